@@ -8,6 +8,7 @@ setup(
         "python-docx>=0.8.11",
         "fpdf>=1.7.2",
         "pandas>=1.0.0",
+        "numpy",
     ],
     author="Nolan Leavitt",
     author_email="leavittnolan20@gmail.com",
@@ -1,16 +1,182 @@
-from docx import Document
-from docx.shared import Inches, Pt
-from fpdf import FPDF
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+import io
+import os
+import tempfile
+from xml.sax.saxutils import escape, quoteattr
+import zipfile
+
+import numpy as np
 import pandas as pd
 
+# Width graphs are displayed at in Word reports; graph PNGs are rendered to match it.
+_GRAPH_WIDTH_IN = 6
+
+
+class _MediaStoredZipWriter:
+    """
+    Zip writer for python-docx's PackageWriter that stores media parts (PNG graphs, which
+    are already compressed) as-is and deflates everything else.
+    """
+
+    def __init__(self, zipf):
+        self._zipf = zipf
+
+    def write(self, pack_uri, blob):
+        name = pack_uri.membername
+        if name.startswith('word/media/'):
+            self._zipf.writestr(name, blob, compress_type=zipfile.ZIP_STORED)
+        else:
+            self._zipf.writestr(name, blob)
+
+
+def _save_docx(doc, path):
+    """Save a docx Document like doc.save(path), without re-deflating its media parts."""
+    from docx.opc.pkgwriter import PackageWriter
+
+    # This copies OpcPackage.save / PackageWriter.write with our own zip writer, using
+    # python-docx private helpers; re-check it against those when upgrading python-docx.
+    package = doc.part.package
+    for part in package.parts:
+        part.before_marshal()
+    with zipfile.ZipFile(path, 'w', compression=zipfile.ZIP_DEFLATED) as zipf:
+        writer = _MediaStoredZipWriter(zipf)
+        PackageWriter._write_content_types_stream(writer, package.parts)
+        PackageWriter._write_pkg_rels(writer, package.rels)
+        PackageWriter._write_parts(writer, package.parts)
+
+
+def _text_xml(text):
+    r"""
+    Return escaped <w:t> markup for a cell's text, turning tabs into <w:tab/> and line breaks
+    (\n, \r or \r\n) into <w:br/>.
+    """
+    text = escape(text)
+    if '\r' in text:
+        text = text.replace('\r\n', '\n').replace('\r', '\n')
+    if '\t' in text or '\n' in text:
+        text = (text.replace('\t', '</w:t><w:tab/><w:t xml:space="preserve">')
+                    .replace('\n', '</w:t><w:br/><w:t xml:space="preserve">'))
+    return '<w:t xml:space="preserve">%s</w:t>' % text
+
+
+@lru_cache(maxsize=None)
+def _cell_open_xml(col_width, fill=None, p_pr='', r_pr=''):
+    """
+    Return the markup that opens a table cell up to its text: <w:tcPr> with the width and
+    optional <w:shd> fill, then the paragraph and run with their optional properties.
+    Cached so each fill/width combination is formatted once and reused across tables.
+    """
+    shd = '<w:shd w:fill=%s/>' % quoteattr(str(fill)) if fill else ''
+    return '<w:tc><w:tcPr><w:tcW w:w="%d" w:type="dxa"/>%s</w:tcPr><w:p>%s<w:r>%s' % (col_width, shd, p_pr, r_pr)
+
+
+# Markup that closes every table cell after its text, and the 0.25 inch first-cell indent.
+_TC_CLOSE = '</w:r></w:p></w:tc>'
+_INDENT_PPR = '<w:pPr><w:ind w:left="360"/></w:pPr>'
+
+# Word tables longer than this are emitted in slices of this many rows (see _write_word_table).
+_TABLE_CHUNK_ROWS = 5000
+
+
+def _table_head_xml(df, theme, col_width):
+    """
+    Build the opening of a <w:tbl> element for a DataFrame: table properties (horizontal-only
+    borders and the optional fixed width from the theme), the column grid and the header row
+    (bold text and header background). The closing </w:tbl> is left to the caller.
+    col_width is the width of each column in twips.
+    """
+    from docx.oxml.ns import nsdecls
+
+    if theme.get('table_width'):
+        tbl_w = '<w:tblW w:w="%s" w:type="dxa"/>' % escape(str(theme['table_width']))
+    else:
+        tbl_w = '<w:tblW w:type="auto" w:w="0"/>'
+
+    # Header row: bold is set once in the shared run properties rather than per run.
+    hdr_open = _cell_open_xml(col_width, theme.get('header_bg_color'), r_pr='<w:rPr><w:b/></w:rPr>')
+    return ''.join([
+        '<w:tbl %s>' % nsdecls('w'),
+        '<w:tblPr><w:tblStyle w:val="TableGrid"/>', tbl_w,
+        # Remove vertical lines (keeping horizontal lines).
+        '<w:tblBorders>'
+        '<w:top w:val="single" w:sz="4" w:space="0" w:color="auto"/>'
+        '<w:left w:val="nil"/>'
+        '<w:bottom w:val="single" w:sz="4" w:space="0" w:color="auto"/>'
+        '<w:right w:val="nil"/>'
+        '<w:insideH w:val="single" w:sz="4" w:space="0" w:color="auto"/>'
+        '<w:insideV w:val="nil"/>'
+        '</w:tblBorders>'
+        '<w:tblLook w:firstColumn="1" w:firstRow="1" w:lastColumn="0" w:lastRow="0" w:noHBand="0" w:noVBand="1" w:val="04A0"/>'
+        '</w:tblPr><w:tblGrid>',
+        '<w:gridCol w:w="%d"/>' % col_width * len(df.columns),
+        '</w:tblGrid>',
+        '<w:tr>' + hdr_open + (_TC_CLOSE + hdr_open).join(_text_xml(str(c)) for c in df.columns)
+        + _TC_CLOSE + '</w:tr>',
+    ])
+
+
+def _table_rows_xml(df, theme, indent_rows, col_width, start=0):
+    """
+    Build the <w:tr> data rows for a DataFrame (or a slice of one) as a single XML string,
+    with alternating row shading and first-cell indentation for indent_rows (a set).
+    start is the data-row index of the slice's first row, so shading and indentation line
+    up with the full table.
+    """
+    even_color = theme.get('row_bg_color_even')
+    odd_color = theme.get('row_bg_color_odd')
+
+    # Data rows, stringified in one vectorized pass and turned into plain lists of str,
+    # which iterate faster than indexing numpy element by element. Going through object
+    # dtype makes every cell (NaN, None, pd.NA, Timestamps) read as str(value).
+    rows = df.to_numpy(dtype=object).astype(str).tolist()
+    parts = []
+    if not indent_rows and not even_color and not odd_color:
+        # Plain rows: every data cell opens the same way, so skip the per-row styling decisions.
+        cell_open = _cell_open_xml(col_width)
+        sep = _TC_CLOSE + cell_open
+        for row in rows:
+            parts.append('<w:tr>' + cell_open + sep.join(map(_text_xml, row)) + _TC_CLOSE + '</w:tr>')
+    else:
+        row_open = (_cell_open_xml(col_width, even_color), _cell_open_xml(col_width, odd_color))
+        first_open_indented = (_cell_open_xml(col_width, even_color, _INDENT_PPR),
+                               _cell_open_xml(col_width, odd_color, _INDENT_PPR))
+        for i, row in enumerate(rows, start):
+            cell_open = row_open[i % 2]
+            first_open = first_open_indented[i % 2] if i in indent_rows else cell_open
+            sep = _TC_CLOSE + cell_open
+            parts.append('<w:tr>' + first_open + sep.join(map(_text_xml, row)) + _TC_CLOSE + '</w:tr>')
+    return ''.join(parts)
+
+
+def _build_table_xml(df, theme, indent_rows, col_width):
+    """Build the complete <w:tbl> element for a DataFrame as a single XML string."""
+    return _table_head_xml(df, theme, col_width) + _table_rows_xml(df, theme, indent_rows, col_width) + '</w:tbl>'
+
+
 class StatPrint:
-    def __init__(self, filename="report", doc_type="word", title="Report", table_theme=None):
+    def __init__(self, filename="report", doc_type="word", title="Report", table_theme=None, streaming=False,
+                 table_workers=1, graph_dpi=100):
         # Initialize with default filename, document type, and title
         self.filename = filename
         self.doc_type = doc_type
         self.title = title
         self.content = []
         self.graph_count = 0  # To create unique filenames for graphs
+
+        # In streaming mode (Word only) each item is written to an open Document as soon as
+        # it is added instead of being buffered in self.content until generate_report.
+        self._doc = None
+        if streaming and doc_type == 'word':
+            from docx import Document
+            self._doc = Document()
+        self._title_written = False
+
+        # Number of worker processes used to build Word table XML when a buffered report
+        # holds several tables; 1 builds them in this process. Scripts using more than one
+        # worker need the usual `if __name__ == "__main__":` guard on spawn-based platforms.
+        self.table_workers = table_workers
+        self.graph_dpi = graph_dpi  # Pixels per inch of a graph at its embedded width (see add_graph).
         
         # Set a default table theme if one isn't provided.
         # Colors are given as hex strings (without '#').
@@ -29,6 +195,7 @@ class StatPrint:
     def add_cover_page(self, title, subtitle=None, author=None, date=None):
         """
         Add a cover page to the report. This will be inserted at the beginning.
+        In streaming mode it must be added before any other content.
         """
         cover_content = {
             'title': title,
@@ -36,11 +203,19 @@ class StatPrint:
             'author': author,
             'date': date
         }
+        if self._doc is not None:
+            if self._title_written:
+                raise ValueError("In streaming mode the cover page must be added before any other content.")
+            self._write_word_cover(self._doc, cover_content)
+            return
         # Insert at the beginning of content
         self.content.insert(0, ('cover', cover_content))
 
     def add_heading(self, heading):
         """Add a heading to the report."""
+        if self._doc is not None:
+            self._stream_word('heading', heading)
+            return
         self.content.append(('heading', heading))
 
     def add_table(self, data, custom_headers=None, indent_rows=None):
@@ -53,8 +228,8 @@ class StatPrint:
           - indent_rows: Optional list of row indices (starting at 0 for the first data row)
                          that should have their first cell indented.
         """
-        if indent_rows is None:
-            indent_rows = []
+        # Stored as a frozenset so both backends get O(1) row membership checks.
+        indent_rows = frozenset(indent_rows) if indent_rows is not None else frozenset()
 
         if isinstance(data, pd.Series):
             # For Series (often from value_counts), reset the index so that you have two columns.
@@ -70,24 +245,51 @@ class StatPrint:
             if custom_headers is not None:
                 df.columns = custom_headers
 
+        table_info = {'df': df, 'custom_headers': custom_headers, 'indent_rows': indent_rows}
+        if self._doc is not None:
+            self._stream_word('table', table_info)
+            return
         # Store the table with additional styling options.
-        self.content.append(('table', {'df': df, 'custom_headers': custom_headers, 'indent_rows': indent_rows}))
+        self.content.append(('table', table_info))
 
-    def add_graph(self, graph, filename=None):
+    def add_graph(self, graph, filename=None, dpi=None):
         """
-        Save the graph (a matplotlib figure) to a unique file and add its filename to the report.
+        Render the graph (a matplotlib figure) to an in-memory PNG and add it to the report.
+        The PNG is cropped to the figure content and written with maximum compression.
+        Its pixel width is matched to the width the graph is embedded at, so no more pixels
+        are stored than the report displays; the figure's own size and layout are untouched.
         
         Parameters:
-          - graph: a matplotlib figure object.
-          - filename: Optional filename base; if provided the counter is prepended.
+          - graph: a matplotlib figure, or a seaborn grid exposing .figure and .savefig.
+          - filename: Optional filename base; if provided the PNG is also saved to disk
+                      under this name with the counter prepended.
+          - dpi: Optional resolution for this graph at its embedded width; defaults to the
+                 instance's graph_dpi.
         """
-        if filename is None:
-            filename = f"graph_{self.graph_count}.png"
-        else:
-            filename = f"{self.graph_count}_{filename}"
+        # Scale the save DPI so the saved image comes out at _GRAPH_WIDTH_IN * dpi pixels wide.
+        # bbox_inches='tight' crops the figure to its content plus savefig.pad_inches on each
+        # side, so measure that width rather than the full figure width.
+        # seaborn grids (FacetGrid, PairGrid, JointGrid) wrap their figure in .figure; they are
+        # still saved through their own savefig below. Leaving out the renderer lets matplotlib
+        # pick one that works for any canvas.
+        import matplotlib
+
+        fig = getattr(graph, 'figure', graph)
+        tight_width_in = fig.get_tightbbox().width
+        saved_width_in = tight_width_in + 2 * matplotlib.rcParams['savefig.pad_inches']
+        save_dpi = (dpi or self.graph_dpi) * _GRAPH_WIDTH_IN / saved_width_in
+        buf = io.BytesIO()
+        graph.savefig(buf, format='png', dpi=save_dpi, bbox_inches='tight',
+                      pil_kwargs={'optimize': True, 'compress_level': 9})
+        buf.seek(0)
+        if filename is not None:
+            with open(f"{self.graph_count}_{filename}", 'wb') as f:
+                f.write(buf.getvalue())
         self.graph_count += 1
-        graph.savefig(filename, format='png')
-        self.content.append(('graph', filename))
+        if self._doc is not None:
+            self._stream_word('graph', buf)
+            return
+        self.content.append(('graph', buf))
 
     def generate_report(self):
         if self.doc_type == 'word':
@@ -95,152 +297,151 @@ class StatPrint:
         elif self.doc_type == 'pdf':
             self.generate_pdf_report()
 
-    def _set_cell_background(self, cell, color):
-        """
-        Helper method to set the background shading for a cell.
-        :param cell: A docx TableCell object.
-        :param color: A hex color string (without the '#' symbol).
-        """
-        from docx.oxml import OxmlElement
-        from docx.oxml.ns import qn
-        tcPr = cell._tc.find(qn('w:tcPr'))
-        if tcPr is None:
-            tcPr = OxmlElement('w:tcPr')
-            cell._tc.insert(0, tcPr)
-        shd = OxmlElement('w:shd')
-        shd.set(qn('w:fill'), color)
-        tcPr.append(shd)
-
-    def _apply_word_table_style(self, table, indent_rows):
+    def _write_word_cover(self, doc, cover):
+        """Write a cover page (followed by a page break) to a docx Document."""
+        # Create a cover page with the provided details.
+        doc.add_paragraph()  # add some spacing at the top
+        title_par = doc.add_heading(cover.get('title', self.title), level=0)
+        if cover.get('subtitle'):
+            sub_par = doc.add_paragraph(cover.get('subtitle'))
+        if cover.get('author'):
+            doc.add_paragraph("Author: " + cover.get('author'))
+        if cover.get('date'):
+            doc.add_paragraph("Date: " + cover.get('date'))
+        # Add a page break after the cover page.
+        doc.add_page_break()
+
+    def _write_word_table(self, doc, df, indent_rows):
         """
-        Helper method to modify a docx table:
-          - Applies header styling (bold text and background color).
-          - Sets alternating row shading for data rows.
-          - Applies left indentation for specified rows.
-          - Optionally sets a fixed table width.
+        Write a DataFrame to a docx Document as a styled table. The table is built as XML
+        strings and parsed in bulk rather than cell by cell through python-docx: in a single
+        call for most tables, one call per _TABLE_CHUNK_ROWS rows for long ones.
         """
-        from docx.oxml import OxmlElement, parse_xml
-        from docx.oxml.ns import nsdecls, qn
-
-        # Process header row: bold text and header background.
-        hdr_cells = table.rows[0].cells
-        for cell in hdr_cells:
-            for paragraph in cell.paragraphs:
-                for run in paragraph.runs:
-                    run.bold = True
-            # Set header background color.
-            if self.table_theme.get('header_bg_color'):
-                self._set_cell_background(cell, self.table_theme['header_bg_color'])
-
-        # Process data rows: alternating shading and indent if required.
-        for i, row in enumerate(table.rows[1:]):  # skip header row
-            # Determine fill color based on row index.
-            if i % 2 == 0 and self.table_theme.get('row_bg_color_even'):
-                fill_color = self.table_theme['row_bg_color_even']
-            elif i % 2 == 1 and self.table_theme.get('row_bg_color_odd'):
-                fill_color = self.table_theme['row_bg_color_odd']
-            else:
-                fill_color = None
-
-            for cell in row.cells:
-                if fill_color:
-                    self._set_cell_background(cell, fill_color)
-
-            # Apply left indentation if this row is marked for indenting.
-            if i in indent_rows:
-                first_cell = row.cells[0]
-                for paragraph in first_cell.paragraphs:
-                    paragraph.paragraph_format.left_indent = Inches(0.25)
-
-        # Optionally, set a fixed table width.
-        if self.table_theme.get('table_width'):
-            tbl = table._element
-            tblPr = tbl.find(qn('w:tblPr'))
-            if tblPr is None:
-                tblPr = OxmlElement('w:tblPr')
-                tbl.insert(0, tblPr)
-            tblW = tblPr.find(qn('w:tblW'))
-            if tblW is None:
-                tblW = OxmlElement('w:tblW')
-                tblPr.append(tblW)
-            tblW.set(qn('w:w'), str(self.table_theme['table_width']))
-            tblW.set(qn('w:type'), 'dxa')
-
-        # Adjust borders to remove vertical lines (keeping horizontal lines).
-        tblBorders = parse_xml(
-            r'<w:tblBorders %s>'
-            r'<w:top w:val="single" w:sz="4" w:space="0" w:color="auto"/>'
-            r'<w:left w:val="nil"/>'
-            r'<w:bottom w:val="single" w:sz="4" w:space="0" w:color="auto"/>'
-            r'<w:right w:val="nil"/>'
-            r'<w:insideH w:val="single" w:sz="4" w:space="0" w:color="auto"/>'
-            r'<w:insideV w:val="nil"/>'
-            r'</w:tblBorders>' % nsdecls('w')
-        )
-        tblPr.append(tblBorders)
+        from docx.oxml import parse_xml
+        from docx.oxml.ns import nsdecls
+
+        col_width = self._word_col_width(doc, df)
+        if len(df) <= _TABLE_CHUNK_ROWS:
+            self._insert_word_table_xml(doc, _build_table_xml(df, self.table_theme, indent_rows, col_width))
+            return
+
+        # Long tables: insert the table with just its header, then parse and append the data
+        # rows one slice at a time so only a slice's strings and markup are alive at once.
+        tbl = parse_xml(_table_head_xml(df, self.table_theme, col_width) + '</w:tbl>')
+        doc.element.body._insert_tbl(tbl)
+        for start in range(0, len(df), _TABLE_CHUNK_ROWS):
+            rows_xml = _table_rows_xml(df.iloc[start:start + _TABLE_CHUNK_ROWS], self.table_theme,
+                                       indent_rows, col_width, start)
+            tbl.extend(parse_xml('<w:tbl %s>%s</w:tbl>' % (nsdecls('w'), rows_xml)))
+
+    def _word_col_width(self, doc, df):
+        """Column width in twips: the text block width split evenly, as doc.add_table does."""
+        from docx.shared import Emu
+        return Emu(doc._block_width // len(df.columns)).twips
+
+    def _insert_word_table_xml(self, doc, xml):
+        """Parse a <w:tbl> XML string and insert it at the end of the document body."""
+        from docx.oxml import parse_xml
+        doc.element.body._insert_tbl(parse_xml(xml))
+
+    def _write_word_content(self, doc, content_type, content):
+        """Write a single heading, table or graph item to a docx Document."""
+        from docx.shared import Inches
+        if content_type == 'heading':
+            doc.add_heading(content, level=1)
+        elif content_type == 'table':
+            self._write_word_table(doc, content['df'], content.get('indent_rows', frozenset()))
+        elif content_type == 'graph':
+            doc.add_paragraph()  # add spacing before image
+            content.seek(0)
+            doc.add_picture(content, width=Inches(_GRAPH_WIDTH_IN))
+
+    def _stream_word(self, content_type, content):
+        """Write an item straight to the open streaming Document, adding the report title first."""
+        if not self._title_written:
+            self._doc.add_heading(self.title, 0)
+            self._title_written = True
+        self._write_word_content(self._doc, content_type, content)
 
     def generate_word_report(self):
-        doc = Document()
-
-        # If a cover page was added, process it first.
-        # Check if the first content element is a cover.
-        if self.content and self.content[0][0] == 'cover':
-            cover = self.content.pop(0)[1]
-            # Create a cover page with the provided details.
-            doc.add_paragraph()  # add some spacing at the top
-            title_par = doc.add_heading(cover.get('title', self.title), level=0)
-            if cover.get('subtitle'):
-                sub_par = doc.add_paragraph(cover.get('subtitle'))
-            if cover.get('author'):
-                doc.add_paragraph("Author: " + cover.get('author'))
-            if cover.get('date'):
-                doc.add_paragraph("Date: " + cover.get('date'))
-            # Add a page break after the cover page.
-            doc.add_page_break()
-
-        # Add the report title.
-        doc.add_heading(self.title, 0)
+        if self._doc is not None:
+            # Streaming mode: everything has already been written, so just save.
+            doc = self._doc
+            if not self._title_written:
+                doc.add_heading(self.title, 0)
+                self._title_written = True
+        else:
+            from docx import Document
+            doc = Document()
 
-        for content_type, content in self.content:
-            if content_type == 'heading':
-                doc.add_heading(content, level=1)
-            elif content_type == 'table':
-                table_info = content
-                df = table_info['df']
-                indent_rows = table_info.get('indent_rows', [])
-                # Create a table with one header row and as many columns as the DataFrame has.
-                table = doc.add_table(rows=1, cols=len(df.columns))
-                table.style = 'Table Grid'
-
-                # Add header cells.
-                hdr_cells = table.rows[0].cells
-                for i, col_name in enumerate(df.columns):
-                    hdr_cells[i].text = str(col_name)
-                    # Bold header text and apply header background via _apply_word_table_style.
-                    for paragraph in hdr_cells[i].paragraphs:
-                        for run in paragraph.runs:
-                            run.bold = True
-
-                # Add data rows.
-                for idx, row in enumerate(df.itertuples(index=False, name=None)):
-                    row_cells = table.add_row().cells
-                    for j, value in enumerate(row):
-                        row_cells[j].text = str(value)
-                        # Apply indentation if needed.
-                        if j == 0 and idx in indent_rows:
-                            for paragraph in row_cells[j].paragraphs:
-                                paragraph.paragraph_format.left_indent = Inches(0.25)
-
-                # Apply publication-ready styling (header styling, alternating row shading, etc.).
-                self._apply_word_table_style(table, indent_rows)
-            elif content_type == 'graph':
-                doc.add_paragraph()  # add spacing before image
-                doc.add_picture(content, width=Inches(6))  # adjust width as needed
+            # If a cover page was added, process it first.
+            # Check if the first content element is a cover.
+            if self.content and self.content[0][0] == 'cover':
+                self._write_word_cover(doc, self.content.pop(0)[1])
+
+            # Add the report title.
+            doc.add_heading(self.title, 0)
+
+            # Tables are independent of each other, so with several workers their XML is
+            # built in parallel up front and then inserted in report order.
+            tables = [content for content_type, content in self.content if content_type == 'table']
+            prebuilt = None
+            if self.table_workers > 1 and len(tables) > 1:
+                with ProcessPoolExecutor(max_workers=self.table_workers) as executor:
+                    prebuilt = iter(list(executor.map(
+                        _build_table_xml,
+                        [t['df'] for t in tables],
+                        [self.table_theme] * len(tables),
+                        [t.get('indent_rows', frozenset()) for t in tables],
+                        [self._word_col_width(doc, t['df']) for t in tables],
+                    )))
+
+            for content_type, content in self.content:
+                if content_type == 'table' and prebuilt is not None:
+                    self._insert_word_table_xml(doc, next(prebuilt))
+                else:
+                    self._write_word_content(doc, content_type, content)
 
-        doc.save(f"{self.filename}.docx")
+        _save_docx(doc, f"{self.filename}.docx")
         print(f"Report saved as {self.filename}.docx")
 
+    def _add_pdf_image(self, pdf, buf, w):
+        """
+        Place an in-memory PNG on the PDF at the current position. fpdf2 reads the buffer
+        directly; fpdf 1.x only reads from a path, so the bytes go through a temporary file.
+        """
+        from fpdf import FPDF_VERSION
+        buf.seek(0)
+        if not FPDF_VERSION.startswith('1.'):
+            pdf.image(buf, x=None, y=None, w=w)
+            return
+        with tempfile.NamedTemporaryFile(suffix='.png', delete=False) as f:
+            f.write(buf.getvalue())
+        try:
+            pdf.image(f.name, x=None, y=None, w=w)
+        finally:
+            os.remove(f.name)
+
+    def _draw_pdf_rules(self, pdf, ys, right):
+        """
+        Draw a horizontal table line at each y position on the current page, then clear the list.
+        All lines go out as one path with a single stroke instead of one pdf.line() call
+        (and one stroke operator) per row; the operators match what pdf.line() writes.
+        """
+        if not ys:
+            return
+        k, h = pdf.k, pdf.h
+        x1 = '%.2f' % (pdf.l_margin * k)
+        x2 = '%.2f' % (right * k)
+        segments = []
+        for y in ys:
+            py = '%.2f' % ((h - y) * k)
+            segments.append('%s %s m %s %s l' % (x1, py, x2, py))
+        pdf._out(' '.join(segments) + ' S')
+        ys.clear()
+
     def generate_pdf_report(self):
+        from fpdf import FPDF
         pdf = FPDF()
         pdf.set_auto_page_break(auto=True, margin=15)
         pdf.add_page()
@@ -260,10 +461,12 @@ class StatPrint:
             elif content_type == 'table':
                 table_info = content
                 df = table_info['df']
-                indent_rows = table_info.get('indent_rows', [])
+                indent_rows = table_info.get('indent_rows', frozenset())
 
                 # Calculate effective page width.
-                effective_width = pdf.w - 2 * pdf.l_margin
+                lm = pdf.l_margin
+                effective_width = pdf.w - 2 * lm
+                right = lm + effective_width
                 col_width = effective_width / len(df.columns)
                 
                 # Header row (bold, no cell borders; draw a horizontal line below).
@@ -272,22 +475,42 @@ class StatPrint:
                     pdf.cell(col_width, 10, str(col), border=0, align='C')
                 pdf.ln(10)
                 # Draw horizontal line below header.
-                pdf.line(pdf.l_margin, pdf.get_y(), pdf.l_margin + effective_width, pdf.get_y())
+                y = pdf.get_y()
+                pdf.line(lm, y, right, y)
+
+                # Data rows: stringify the whole table once and indent the marked rows up front.
+                # Going through object dtype makes every cell (NaN, None, pd.NA, Timestamps) read as str(value).
+                arr = df.to_numpy(dtype=object).astype(str)
+                nrows, ncols = arr.shape
+                if nrows and indent_rows:
+                    # Select the in-range indent rows with numpy too, so no Python-level loop remains.
+                    idx = np.fromiter(indent_rows, dtype=np.intp, count=len(indent_rows))
+                    idx = idx[(idx >= 0) & (idx < nrows)]
+                    arr = arr.astype(object)  # so the longer, indented strings are not truncated
+                    arr[idx, 0] = np.char.add("    ", arr[idx, 0].astype(str))  # Indent if needed.
 
-                # Data rows.
                 pdf.set_font("Arial", '', 10)
-                for i, row in enumerate(df.itertuples(index=False, name=None)):
-                    for j, value in enumerate(row):
-                        text = str(value)
-                        if j == 0 and i in indent_rows:
-                            text = "    " + text  # Indent if needed.
-                        pdf.cell(col_width, 10, text, border=0)
-                    pdf.ln(10)
-                    # Draw horizontal line after each row.
-                    pdf.line(pdf.l_margin, pdf.get_y(), pdf.l_margin + effective_width, pdf.get_y())
+                # Bind everything the row loop touches to locals.
+                cell = pdf.cell
+                cw = col_width
+                last = ncols - 1
+                break_y = pdf.page_break_trigger - 10  # A row starting below this goes to a new page.
+                # Horizontal lines below each row are collected and drawn in one pass per page.
+                rule_ys = []
+                add_rule = rule_ys.append
+                draw_rules = self._draw_pdf_rules
+                for row in arr.tolist():
+                    if pdf.y > break_y:
+                        # This row starts a new page, so draw the current page's lines first.
+                        draw_rules(pdf, rule_ys, right)
+                    for text in row[:last]:
+                        cell(cw, 10, text, 0)
+                    cell(cw, 10, row[last], 0, 1)  # ln=1 moves to the start of the next row.
+                    add_rule(pdf.y)
+                self._draw_pdf_rules(pdf, rule_ys, right)
             elif content_type == 'graph':
                 pdf.ln(10)
-                pdf.image(content, x=None, y=None, w=150)  # Adjust width as necessary
+                self._add_pdf_image(pdf, content, w=150)  # Adjust width as necessary
 
         pdf.output(f"{self.filename}.pdf")
         print(f"Report saved as {self.filename}.pdf")
\ No newline at end of file
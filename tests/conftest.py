@@ -0,0 +1,5 @@
+import os
+import sys
+
+# statprint is a single top-level module; make it importable when running pytest from anywhere.
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
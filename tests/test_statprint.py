@@ -0,0 +1,289 @@
+import re
+import zlib
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from statprint import StatPrint
+
+
+def _pdf_page_content(path):
+    """Return the decompressed content streams of a generated PDF as one string."""
+    data = open(path, 'rb').read()
+    streams = []
+    for match in re.finditer(rb'stream\r?\n(.*?)\r?\nendstream', data, re.S):
+        try:
+            streams.append(zlib.decompress(match.group(1)).decode('latin-1'))
+        except zlib.error:
+            pass
+    return '\n'.join(streams)
+
+
+@pytest.fixture
+def missing_and_datetime_df():
+    return pd.DataFrame({
+        'num': [1.5, np.nan],
+        'text': ['p', None],
+        'when': pd.to_datetime(['2020-01-01', None]),
+    })
+
+
+def test_pdf_table_renders_missing_and_datetime_values(tmp_path, missing_and_datetime_df):
+    report = StatPrint(filename=str(tmp_path / 'report'), doc_type='pdf')
+    report.add_table(missing_and_datetime_df, indent_rows=[1])
+    report.generate_report()
+
+    content = _pdf_page_content(tmp_path / 'report.pdf')
+    for text in ['1.5', '    nan', 'NaT', '2020-01-01 00:00:00']:
+        assert '(%s) Tj' % text in content
+
+
+def test_pdf_indent_is_not_truncated_for_int_table(tmp_path):
+    report = StatPrint(filename=str(tmp_path / 'report'), doc_type='pdf')
+    report.add_table(pd.DataFrame({'a': [12345, 2]}), indent_rows=[0])
+    report.generate_report()
+
+    assert '(    12345) Tj' in _pdf_page_content(tmp_path / 'report.pdf')
+
+
+def _word_table_text(path):
+    from docx import Document
+
+    table = Document(path).tables[0]
+    return [[cell.text for cell in row.cells] for row in table.rows]
+
+
+@pytest.mark.parametrize('options', [{}, {'streaming': True}, {'table_workers': 2}])
+def test_word_table_renders_missing_and_datetime_values(tmp_path, missing_and_datetime_df, options):
+    report = StatPrint(filename=str(tmp_path / 'report'), **options)
+    report.add_table(missing_and_datetime_df)
+    # A second table so the table_workers path actually uses the process pool.
+    report.add_table(pd.Series([1, None, 3]).value_counts(dropna=False))
+    report.generate_report()
+
+    assert _word_table_text(tmp_path / 'report.docx') == [
+        ['num', 'text', 'when'],
+        ['1.5', 'p', '2020-01-01 00:00:00'],
+        ['nan', 'nan', 'NaT'],
+    ]
+
+
+def _reference_word_table(doc, df, theme, indent_rows):
+    """Build a table cell by cell through python-docx, the way StatPrint originally did."""
+    from docx.oxml import OxmlElement, parse_xml
+    from docx.oxml.ns import nsdecls, qn
+    from docx.shared import Inches
+
+    def shade(cell, color):
+        shd = OxmlElement('w:shd')
+        shd.set(qn('w:fill'), color)
+        cell._tc.get_or_add_tcPr().append(shd)
+
+    table = doc.add_table(rows=1, cols=len(df.columns))
+    table.style = 'Table Grid'
+    for cell, col_name in zip(table.rows[0].cells, df.columns):
+        cell.text = str(col_name)
+        for run in cell.paragraphs[0].runs:
+            run.bold = True
+        if theme.get('header_bg_color'):
+            shade(cell, theme['header_bg_color'])
+    for i, row in enumerate(df.itertuples(index=False, name=None)):
+        cells = table.add_row().cells
+        for cell, value in zip(cells, row):
+            cell.text = str(value)
+            fill = theme.get('row_bg_color_even') if i % 2 == 0 else theme.get('row_bg_color_odd')
+            if fill:
+                shade(cell, fill)
+        if i in indent_rows:
+            cells[0].paragraphs[0].paragraph_format.left_indent = Inches(0.25)
+
+    tblPr = table._tbl.tblPr
+    if theme.get('table_width'):
+        tblW = tblPr.find(qn('w:tblW'))
+        tblW.set(qn('w:w'), str(theme['table_width']))
+        tblW.set(qn('w:type'), 'dxa')
+    tblPr.append(parse_xml(
+        '<w:tblBorders %s>'
+        '<w:top w:val="single" w:sz="4" w:space="0" w:color="auto"/>'
+        '<w:left w:val="nil"/>'
+        '<w:bottom w:val="single" w:sz="4" w:space="0" w:color="auto"/>'
+        '<w:right w:val="nil"/>'
+        '<w:insideH w:val="single" w:sz="4" w:space="0" w:color="auto"/>'
+        '<w:insideV w:val="nil"/>'
+        '</w:tblBorders>' % nsdecls('w')
+    ))
+    return table._tbl
+
+
+def _word_table_summary(tbl):
+    """Everything about a <w:tbl> that affects how it renders, independent of markup details."""
+    from docx.oxml.ns import qn
+    from docx.table import _Cell
+
+    tblPr = tbl.tblPr
+    tblW = tblPr.find(qn('w:tblW'))
+    summary = {
+        'style': tblPr.find(qn('w:tblStyle')).get(qn('w:val')),
+        'width': (tblW.get(qn('w:w')), tblW.get(qn('w:type'))),
+        'borders': [(el.tag, sorted(el.attrib.items())) for el in tblPr.find(qn('w:tblBorders'))],
+        'grid': [col.get(qn('w:w')) for col in tbl.tblGrid.gridCol_lst],
+        'cells': [],
+    }
+    for tr in tbl.tr_lst:
+        for tc in tr.tc_lst:
+            tcW = tc.tcPr.find(qn('w:tcW'))
+            shd = tc.tcPr.find(qn('w:shd'))
+            ind = tc.find('.//' + qn('w:ind'))
+            runs = tc.findall('.//' + qn('w:r'))
+            summary['cells'].append({
+                'text': _Cell(tc, None).text,
+                # Line breaks and tabs must be real <w:br/>/<w:tab/> elements, not characters in <w:t>.
+                'runs': [[(el.tag, el.text) for el in r if el.tag != qn('w:rPr')] for r in runs],
+                'width': (tcW.get(qn('w:w')), tcW.get(qn('w:type'))),
+                'fill': shd.get(qn('w:fill')) if shd is not None else None,
+                'bold': all(r.find('%s/%s' % (qn('w:rPr'), qn('w:b'))) is not None for r in runs),
+                'indent': ind.get(qn('w:left')) if ind is not None else None,
+            })
+    return summary
+
+
+@pytest.mark.parametrize('theme', [
+    None,
+    {'header_bg_color': 'C0C0C0', 'row_bg_color_even': None, 'row_bg_color_odd': 'EEEEEE', 'table_width': '7000'},
+    {'header_bg_color': None, 'row_bg_color_even': None, 'row_bg_color_odd': None, 'table_width': None},
+])
+def test_word_table_matches_python_docx_construction(tmp_path, theme):
+    from docx import Document
+
+    df = pd.DataFrame({
+        'label': ['plain', ' padded ', 'a<b & c>"d"', 'tab\there', 'line\nbreak', 'carriage\rreturn'],
+        'value': [1, 2.5, np.nan, -4, 0, 6],
+    })
+    indent_rows = [1, 4]
+    report = StatPrint(filename=str(tmp_path / 'report'), table_theme=theme)
+    report.add_table(df, indent_rows=indent_rows)
+    report.generate_report()
+
+    reference = _reference_word_table(Document(), df, report.table_theme, indent_rows)
+    built = Document(str(tmp_path / 'report.docx')).tables[0]._tbl
+    assert _word_table_summary(built) == _word_table_summary(reference)
+
+
+def test_word_cell_text_treats_crlf_as_one_line_break(tmp_path):
+    report = StatPrint(filename=str(tmp_path / 'report'))
+    report.add_table(pd.DataFrame({'a': ['one\r\ntwo\rthree']}))
+    report.generate_report()
+
+    assert _word_table_text(tmp_path / 'report.docx')[1] == ['one\ntwo\nthree']
+
+
+def test_word_theme_colors_are_escaped(tmp_path):
+    from docx import Document
+
+    theme = {'header_bg_color': 'A"B<C', 'row_bg_color_even': "D'&E", 'row_bg_color_odd': None, 'table_width': None}
+    report = StatPrint(filename=str(tmp_path / 'report'), table_theme=theme)
+    report.add_table(pd.DataFrame({'a': [1]}))
+    report.generate_report()
+
+    fills = [cell['fill'] for cell in _word_table_summary(Document(str(tmp_path / 'report.docx')).tables[0]._tbl)['cells']]
+    assert fills == ['A"B<C', "D'&E"]
+
+
+@pytest.mark.parametrize('figsize', [(3, 2), (6.4, 4.8), (12, 4)])
+@pytest.mark.parametrize('graph_dpi', [100, 150])
+def test_graph_png_width_matches_embed_width(figsize, graph_dpi):
+    matplotlib = pytest.importorskip('matplotlib')
+    matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+    from PIL import Image
+
+    fig, ax = plt.subplots(figsize=figsize)
+    ax.plot([1, 2, 3])
+    ax.set_title('title')
+    report = StatPrint(graph_dpi=graph_dpi)
+    report.add_graph(fig)
+    plt.close(fig)
+
+    width, _ = Image.open(report.content[-1][1]).size
+    assert abs(width - 6 * graph_dpi) <= 0.01 * 6 * graph_dpi
+
+
+class _GridLike:
+    """Stand-in for a seaborn FacetGrid/PairGrid/JointGrid: only .figure and .savefig."""
+
+    def __init__(self, figure):
+        self.figure = figure
+
+    def savefig(self, *args, **kwargs):
+        self.figure.savefig(*args, **kwargs)
+
+
+@pytest.mark.parametrize('wrap', [lambda fig: fig, _GridLike], ids=['figure', 'grid'])
+def test_add_graph_accepts_figures_without_pyplot_and_grids(wrap):
+    pytest.importorskip('matplotlib')
+    from matplotlib.figure import Figure
+    from PIL import Image
+
+    # Built without pyplot, so the canvas is a plain FigureCanvasBase rather than Agg.
+    fig = Figure()
+    fig.add_subplot().plot([1, 2, 3])
+    report = StatPrint()
+    report.add_graph(wrap(fig))
+
+    width, _ = Image.open(report.content[-1][1]).size
+    assert abs(width - 600) <= 6
+
+
+def test_word_report_stores_media_uncompressed_and_reopens(tmp_path):
+    pytest.importorskip('matplotlib')
+    import zipfile
+
+    from docx import Document
+    from matplotlib.figure import Figure
+
+    report = StatPrint(filename=str(tmp_path / 'report'))
+    report.add_table(pd.DataFrame({'a': [1, 2]}))
+    for k in range(2):
+        fig = Figure()
+        fig.add_subplot().plot([1, 2, 3 + k])  # distinct images; python-docx dedupes identical ones
+        report.add_graph(fig)
+    report.generate_report()
+
+    path = tmp_path / 'report.docx'
+    with zipfile.ZipFile(path) as zipf:
+        infos = zipf.infolist()
+    media = [info for info in infos if info.filename.startswith('word/media/')]
+    assert len(media) == 2
+    assert all(info.compress_type == zipfile.ZIP_STORED for info in media)
+    assert all(info.compress_type == zipfile.ZIP_DEFLATED for info in infos if info not in media)
+
+    doc = Document(str(path))
+    assert len(doc.inline_shapes) == 2
+    assert len(doc.tables) == 1
+
+
+@pytest.mark.parametrize('nrows', [7, 8])
+@pytest.mark.parametrize('theme', [
+    None,
+    {'header_bg_color': 'C0C0C0', 'row_bg_color_even': 'F2F2F2', 'row_bg_color_odd': 'EEEEEE', 'table_width': None},
+])
+def test_word_table_slices_match_single_build(tmp_path, monkeypatch, nrows, theme):
+    import zipfile
+
+    import statprint
+
+    df = pd.DataFrame({'a': range(nrows), 'b': ['x%d' % i for i in range(nrows)]})
+    # Indents on both sides of the slice boundaries at rows 2, 4 and 6.
+    indent_rows = [1, 2, 3, 5, 6]
+
+    def build(name):
+        report = StatPrint(filename=str(tmp_path / name), table_theme=theme)
+        report.add_table(df, indent_rows=indent_rows)
+        report.generate_report()
+        with zipfile.ZipFile(tmp_path / ('%s.docx' % name)) as zipf:
+            return zipf.read('word/document.xml')
+
+    single = build('single')
+    monkeypatch.setattr(statprint, '_TABLE_CHUNK_ROWS', 2)
+    assert build('sliced') == single